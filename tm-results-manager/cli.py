@@ -1,6 +1,11 @@
 # Python
+import functools
+import hashlib
 import json
 import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import click
 from datetime import datetime
@@ -11,7 +16,10 @@ from .storage.db import (
     init_db,
     load_log,
     update_log,
-    enqueue_for_parse,
+    enqueue_many,
+    flush_errors,
+    get_meta,
+    set_meta,
     _pretty_from_iso,
 )
 from .pipeline.downloader import download_files
@@ -25,6 +33,16 @@ def _collect_queue_summary(conn, queue_ids: list[int]) -> dict:
     if not queue_ids:
         return {"total": 0, "done": 0, "error": 0, "processing": 0, "queued": 0}
 
+    if len(queue_ids) == 1:
+        # Single-item batches (manual mode) need only a point lookup, not an
+        # aggregate over the queue
+        cur.execute("SELECT status FROM parse_queue WHERE id=?", (queue_ids[0],))
+        row = cur.fetchone()
+        stats = {"total": 1, "done": 0, "error": 0, "processing": 0, "queued": 0}
+        if row:
+            stats[row[0]] = 1
+        return stats
+
     qmarks = ",".join(["?"] * len(queue_ids))
     cur.execute(
         f"SELECT status, COUNT(*) FROM parse_queue WHERE id IN ({qmarks}) GROUP BY status",
@@ -48,6 +66,7 @@ def _collect_recent_errors_for_queue(
     # Return list of (file_path, message) pairs for the given queue items
     if not queue_ids:
         return []
+    flush_errors(conn)  # make any buffered log_error rows visible
     cur = conn.cursor()
     # Find meet_ids for those queue items
     qmarks = ",".join(["?"] * len(queue_ids))
@@ -60,20 +79,25 @@ def _collect_recent_errors_for_queue(
     for _, meet_id, file_path in rows:
         by_meet.setdefault(meet_id, file_path)
 
-    errors = []
-    for meet_id, file_path in by_meet.items():
-        cur.execute(
-            """
-            SELECT message FROM error_log
-            WHERE meet_id = ?
-            ORDER BY id DESC
-            LIMIT ?
-            """,
-            (meet_id, limit_per_meet),
-        )
-        for (msg,) in cur.fetchall():
-            errors.append((file_path or "<unknown>", msg or ""))
-    return errors
+    # One windowed query for the newest messages of every meet instead of a
+    # SELECT ... ORDER BY id DESC LIMIT ? round-trip per meet
+    meet_ids = list(by_meet)
+    qmarks = ",".join(["?"] * len(meet_ids))
+    cur.execute(
+        f"""
+        SELECT meet_id, message FROM (
+            SELECT meet_id, message,
+                   ROW_NUMBER() OVER (PARTITION BY meet_id ORDER BY id DESC) AS rn
+            FROM error_log
+            WHERE meet_id IN ({qmarks})
+        ) WHERE rn <= ?
+        """,
+        (*meet_ids, limit_per_meet),
+    )
+    return [
+        (by_meet[meet_id] or "<unknown>", msg or "")
+        for meet_id, msg in cur.fetchall()
+    ]
 
 
 @click.group(help="TM Results Manager CLI")
@@ -117,6 +141,14 @@ def run(
     - Default: fetch community page, parse, optionally download, update DB, optional CSV export.
     - --process-new: skip page fetch; download and parse only new (downloaded=0) meets in the DB.
     """
+    # Kick off the page fetch while SQLite opens; the network round trip and
+    # the DB setup have nothing in common, so overlap them
+    fetch_future = None
+    if not process_new:
+        fetch_executor = ThreadPoolExecutor(max_workers=1)
+        fetch_future = fetch_executor.submit(fetch_page, URL)
+        fetch_executor.shutdown(wait=False)
+
     conn = init_db()
     cur = conn.cursor()
 
@@ -158,9 +190,12 @@ def run(
             conn.close()
             return
 
-        # Build a minimal regions dict so we can reuse download_files
+        # Build a minimal regions dict so we can reuse download_files; keep
+        # the ids from this SELECT so the enqueue step needs no lookup at all
         regions_payload = {}
+        id_by_url = {}
         for _id, reg, meet_name, url in rows:
+            id_by_url[url] = _id
             regions_payload.setdefault(reg, []).append(
                 {
                     "meet_name": meet_name,
@@ -177,33 +212,22 @@ def run(
         log_data = load_log(conn)
 
         # Download only these meets
-        downloaded_files = download_files(regions_payload, output_dir, log_data)
+        downloaded_files = download_files(regions_payload, output_dir, log_data, conn)
 
         # Update DB for these meets
         update_log(conn, regions_payload, downloaded_files)
 
-        # Enqueue just the newly downloaded files
-        now = datetime.now().isoformat()
-        queue_ids = []
-        for reg, meets in regions_payload.items():
-            for m in meets:
-                fp = downloaded_files.get(m["meet_name"])
-                if not fp:
-                    continue
-                cur.execute("SELECT id FROM meets WHERE url=? LIMIT 1", (m["link"],))
-                meet_row = cur.fetchone()
-                if not meet_row:
-                    continue
-                meet_id = meet_row[0]
-                cur.execute(
-                    "INSERT INTO parse_queue (meet_id, file_path, status, created_at, updated_at) VALUES (?, ?, 'queued', ?, ?)",
-                    (meet_id, fp, now, now),
-                )
-                conn.commit()
-                cur.execute("SELECT last_insert_rowid()")
-                qrow = cur.fetchone()
-                if qrow:
-                    queue_ids.append(qrow[0])
+        # Enqueue just the newly downloaded files; meet ids were captured in
+        # the initial SELECT, so no lookup query is needed here
+        queue_ids = enqueue_many(
+            conn,
+            [
+                (id_by_url[m["link"]], downloaded_files[m["meet_name"]])
+                for meets in regions_payload.values()
+                for m in meets
+                if m["meet_name"] in downloaded_files
+            ],
+        )
 
         # Parse now
         ingest_queue(conn)
@@ -229,61 +253,89 @@ def run(
     Fetch the Swimming NZ community page, parse meets, optionally download files,
     update the database, and optionally export to CSV.
     """
-    html = fetch_page(URL)
+    html = fetch_future.result()
     if not html:
         return
 
-    regions = parse_meets(html)
+    # Memoize the parse: identical page body means identical regions, so
+    # reuse the cached result and skip BeautifulSoup entirely
+    body_sha = hashlib.sha256(html.encode("utf-8")).hexdigest()
+    page_changed = body_sha != get_meta(conn, "last_body_sha256")
+    cached_regions = get_meta(conn, "last_regions_json")
+    if not page_changed and cached_regions:
+        regions = json.loads(cached_regions)
+    else:
+        regions = parse_meets(html)
+        set_meta(conn, "last_body_sha256", body_sha)
+        set_meta(conn, "last_regions_json", json.dumps(regions))
+
     log_data = load_log(conn)
 
     # Filter regions if specified
     if not all_regions and region:
-        regions = {r: regions[r] for r in region if r in regions}
+        regions = {r: regions[r] for r in set(region) & regions.keys()}
 
     downloaded_files = {}
     if download:
-        downloaded_files = download_files(regions, output_dir, log_data)
+        downloaded_files = download_files(regions, output_dir, log_data, conn)
 
-    # Update DB with parsed web data and download results
-    update_log(conn, regions, downloaded_files)
+    # Update DB with parsed web data and download results; an unchanged page
+    # with no fresh downloads has nothing new to record
+    if page_changed or downloaded_files:
+        update_log(conn, regions, downloaded_files)
 
     # Optionally enqueue newly downloaded files for parsing
     if download and enqueue_parse:
         cur = conn.cursor()
-        for region_name, meets in regions.items():
-            for m in meets:
-                meet_name = m["meet_name"]
-                file_path = downloaded_files.get(meet_name)
-                if not file_path:
-                    continue
-                cur.execute(
-                    "SELECT id FROM meets WHERE region=? AND meet_name=?",
-                    (region_name, meet_name),
-                )
-                row = cur.fetchone()
-                if row:
-                    enqueue_for_parse(conn, row[0], file_path)
+        keys = [
+            (region_name, m["meet_name"], downloaded_files[m["meet_name"]])
+            for region_name, meets in regions.items()
+            for m in meets
+            if m["meet_name"] in downloaded_files
+        ]
+        if keys:
+            qmarks = ",".join(["(?, ?)"] * len(keys))
+            cur.execute(
+                f"SELECT region, meet_name, id FROM meets WHERE (region, meet_name) IN (VALUES {qmarks})",
+                [v for region_name, meet_name, _ in keys for v in (region_name, meet_name)],
+            )
+            id_map = {(r, n): i for r, n, i in cur.fetchall()}
+            # One transaction (and one WAL fsync) for the whole enqueue batch
+            enqueue_many(
+                conn,
+                [
+                    (id_map[(region_name, meet_name)], file_path)
+                    for region_name, meet_name, file_path in keys
+                    if (region_name, meet_name) in id_map
+                ],
+            )
     if download and enqueue_parse and parse_now:
         ingest_queue(conn)
     if download and parse_now:
         ingest_queue(conn)
     if export_csv:
-        export_to_csv(regions, log_data, csv_file)
+        export_to_csv(conn, csv_file)
 
-    # Optional: console view
+    # Optional: console view, buffered into a single write instead of a
+    # flushing print per meet
+    lines = []
     for reg, meets in regions.items():
-        print(f"\nRegion: {reg}")
+        lines.append(f"\nRegion: {reg}")
         for m in meets:
-            print(
-                f"  Meet: {m['meet_name']}, Date: {_pretty_from_iso(m["meet_date"])}, Year: {m.get('meet_year')}, Location: {m.get('location')}, Course: {m.get('course')}"
+            meet_date = _pretty_from_iso(m["meet_date"])
+            lines.append(
+                f"  Meet: {m['meet_name']}, Date: {meet_date}, Year: {m.get('meet_year')}, Location: {m.get('location')}, Course: {m.get('course')}"
             )
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     conn.close()
 
 
+@functools.lru_cache(maxsize=1)
 def _read_regions_from_codes() -> list[str]:
     try:
-        data = json.loads(Path(REGION_CODES_PATH).read_text(encoding="utf-8"))
+        data = json.loads(Path(REGION_CODES_PATH).read_bytes())
         return sorted(list(data.keys()))
     except Exception:
         # fallback to known list if file missing
@@ -312,31 +364,33 @@ def _prompt_region() -> str:
         raise click.ClickException("No regions available to choose from.")
 
     # Build a numeric menu
-    choices = {str(i + 1): name for i, name in enumerate(regions)}
     click.echo("Select region:")
-    for num, name in choices.items():
+    for num, name in enumerate(regions, start=1):
         click.echo(f"  {num}) {name}")
 
     # Prompt for a number
-    choice = click.prompt(
-        "Choose a region number",
-        type=click.Choice(list(choices.keys()), case_sensitive=False),
-    )
-    return choices[choice]
+    idx = click.prompt("Choose a region number", type=click.IntRange(1, len(regions)))
+    return regions[idx - 1]
 
 
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
-def _move_zip_into_region(src_file: Path, region: str, downloads_root: Path) -> Path:
+def _move_zip_into_region(
+    src_file: Path, region: str, downloads_root: Path, ensure_dirs: bool = True
+) -> Path:
     """Copy zip into results/<Region> and return destination path. Leaves source in place; caller may delete/move."""
-    _ensure_dir(downloads_root)
     region_dir = downloads_root / region.replace("/", "_")
-    _ensure_dir(region_dir)
+    if ensure_dirs:
+        _ensure_dir(downloads_root)
+        _ensure_dir(region_dir)
     dest = region_dir / src_file.name
-    if src_file.resolve() != dest.resolve():
-        dest.write_bytes(src_file.read_bytes())
+    # samefile is a single stat per path vs resolve()'s walk of every component
+    if not (dest.exists() and os.path.samefile(src_file, dest)):
+        # Kernel-side copy (sendfile/copy_file_range) instead of slurping the
+        # whole zip through a Python bytes object
+        shutil.copyfile(src_file, dest)
     return dest
 
 
@@ -377,69 +431,67 @@ def parse_files(all_downloaded, region, meet_name, manual, manual_bulk, keep_imp
     def choose_region() -> str:
         return region if region else _prompt_region()
 
-    def enqueue_and_parse_for_file(region_name: str, src_zip: Path) -> int | None:
-        # 1) Move/copy into results/<Region>
-        downloads_root = Path(DEFAULT_OUTPUT_DIR)
-        dest_zip = _move_zip_into_region(src_zip, region_name, downloads_root)
-
-        # 2) Upsert a placeholder meet entry (temporary meet_name from filename stem)
-        temp_meet_name = dest_zip.stem
-        now = datetime.now().isoformat()
-        cur.execute(
-            """
-            INSERT INTO meets (region, meet_name, url, processed_timestamp, downloaded, file_path, uploaded, processed_by_target)
-            VALUES (?, ?, ?, ?, 1, ?, 0, 0)
-            ON CONFLICT(file_path) DO UPDATE SET
-              downloaded=1,
-              file_path=excluded.file_path,
-              processed_timestamp=excluded.processed_timestamp
-            """,
-            (
-                region_name,
-                temp_meet_name,
-                f"manual://{dest_zip.name}",
-                now,
-                str(dest_zip),
-            ),
-        )
-        conn.commit()
-
-        # 3) Fetch ID and enqueue
-        cur.execute(
-            "SELECT id FROM meets WHERE region=? AND meet_name=?",
-            (region_name, temp_meet_name),
+    def stage_zip(region_name: str, src_zip: Path, ensure_dirs: bool = True) -> tuple:
+        """Copy a zip into results/<Region>; returns (region, temp_meet_name, url, dest_zip)."""
+        dest_zip = _move_zip_into_region(
+            src_zip, region_name, Path(DEFAULT_OUTPUT_DIR), ensure_dirs=ensure_dirs
         )
-        row = cur.fetchone()
-        if not row:
-            click.echo(f"Failed to upsert meet row for {dest_zip.name}")
-            return None
-        meet_id = row[0]
+        # Temporary meet_name from filename stem until the HY3 parse fills it in
+        return region_name, dest_zip.stem, f"manual://{dest_zip.name}", dest_zip
+
+    def enqueue_staged(staged: list[tuple]) -> list[int]:
+        """
+        Upsert placeholder meet rows and enqueue all staged zips for parsing.
+        One executemany + one id lookup + one commit for the whole batch.
+        """
+        now = datetime.now().isoformat()
+        with conn:
+            cur.executemany(
+                """
+                INSERT INTO meets (region, meet_name, url, processed_timestamp, downloaded, file_path, uploaded, processed_by_target)
+                VALUES (?, ?, ?, ?, 1, ?, 0, 0)
+                ON CONFLICT(file_path) DO UPDATE SET
+                  downloaded=1,
+                  file_path=excluded.file_path,
+                  processed_timestamp=excluded.processed_timestamp
+                """,
+                [
+                    (region_name, temp_meet_name, url, now, str(dest_zip))
+                    for region_name, temp_meet_name, url, dest_zip in staged
+                ],
+            )
 
-        # Enqueue
+        qmarks = ",".join(["?"] * len(staged))
         cur.execute(
-            "INSERT INTO parse_queue (meet_id, file_path, status, created_at, updated_at) VALUES (?, ?, 'queued', ?, ?)",
-            (meet_id, str(dest_zip), now, now),
+            f"SELECT file_path, id FROM meets WHERE file_path IN ({qmarks})",
+            [str(dest_zip) for _, _, _, dest_zip in staged],
         )
-        conn.commit()
-        # Return new queue id
-        cur.execute("SELECT last_insert_rowid()")
-        qid_row = cur.fetchone()
-        queue_id = qid_row[0] if qid_row else None
-
-        # 4) After enqueue, move original into import_files/processed unless keeping
-        if not keep_import:
-            processed_dir = src_zip.parent / "processed"
-            _ensure_dir(processed_dir)
+        id_by_path = dict(cur.fetchall())
+
+        pairs: list[tuple[int, str]] = []
+        for _, _, _, dest_zip in staged:
+            meet_id = id_by_path.get(str(dest_zip))
+            if meet_id is None:
+                click.echo(f"Failed to upsert meet row for {dest_zip.name}")
+                continue
+            pairs.append((meet_id, str(dest_zip)))
+        return enqueue_many(conn, pairs)
+
+    def archive_import(src_zip: Path) -> None:
+        """Move the original zip into import_files/processed unless keeping."""
+        if keep_import:
+            return
+        processed_dir = src_zip.parent / "processed"
+        _ensure_dir(processed_dir)
+        try:
+            src_zip.replace(processed_dir / src_zip.name)
+        except Exception:
+            # Cross-device move: kernel-side copy then unlink
             try:
-                src_zip.replace(processed_dir / src_zip.name)
+                shutil.copyfile(src_zip, processed_dir / src_zip.name)
+                src_zip.unlink(missing_ok=True)
             except Exception:
-                try:
-                    (processed_dir / src_zip.name).write_bytes(src_zip.read_bytes())
-                    src_zip.unlink(missing_ok=True)
-                except Exception:
-                    pass
-
-        return queue_id
+                pass
 
     # Manual single-file mode
     if manual:
@@ -452,21 +504,17 @@ def parse_files(all_downloaded, region, meet_name, manual, manual_bulk, keep_imp
             conn.close()
             return
 
-        choices = {str(i + 1): z for i, z in enumerate(zips)}
         click.echo("Available zips:")
-        for i, z in choices.items():
+        for i, z in enumerate(zips, start=1):
             click.echo(f"{i}) {z.name}")
-        choice = click.prompt(
-            "Choose a file number",
-            type=click.Choice(list(choices.keys()), case_sensitive=False),
-        )
-        src_zip = choices[choice]
+        idx = click.prompt("Choose a file number", type=click.IntRange(1, len(zips)))
+        src_zip = zips[idx - 1]
 
-        queue_id = enqueue_and_parse_for_file(chosen_region, src_zip)
+        qids = enqueue_staged([stage_zip(chosen_region, src_zip)])
+        archive_import(src_zip)
         ingest_queue(conn)
 
         # Summary
-        qids = [queue_id] if queue_id else []
         stats = _collect_queue_summary(conn, qids)
         errors = _collect_recent_errors_for_queue(conn, qids)
         if stats.get("error", 0) > 0 or errors:
@@ -494,13 +542,28 @@ def parse_files(all_downloaded, region, meet_name, manual, manual_bulk, keep_imp
             return
 
         click.echo(f"Found {len(zips)} zip(s) in {default_dir}")
-        queue_ids: list[int] = []
+        jobs = []
         for src_zip in zips:
             chosen_region = choose_region()
             click.echo(f"Processing: {src_zip.name} -> Region: {chosen_region}")
-            qid = enqueue_and_parse_for_file(chosen_region, src_zip)
-            if qid:
-                queue_ids.append(qid)
+            jobs.append((chosen_region, src_zip))
+
+        # Create each region directory once up front instead of per file
+        downloads_root = Path(DEFAULT_OUTPUT_DIR)
+        _ensure_dir(downloads_root)
+        for region_name in {r for r, _ in jobs}:
+            _ensure_dir(downloads_root / region_name.replace("/", "_"))
+
+        # Copies are I/O-bound; overlap them once the prompts are done
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as ex:
+            staged = list(
+                ex.map(lambda job: stage_zip(job[0], job[1], ensure_dirs=False), jobs)
+            )
+
+        # One batched upsert/enqueue for all staged zips, then archive originals
+        queue_ids = enqueue_staged(staged)
+        for src_zip in zips:
+            archive_import(src_zip)
 
         ingest_queue(conn)
 
@@ -533,7 +596,9 @@ def parse_files(all_downloaded, region, meet_name, manual, manual_bulk, keep_imp
         )
     elif all_downloaded:
         cur.execute(
-            "SELECT id, file_path FROM meets WHERE downloaded=1 AND (parsed IS NULL OR parsed=0)"
+            # parsed is backfilled to 0 in init_db, so plain equality suffices
+            # and the planner can use the partial unparsed index
+            "SELECT id, file_path FROM meets WHERE downloaded=1 AND parsed=0"
         )
     else:
         print(
@@ -544,18 +609,7 @@ def parse_files(all_downloaded, region, meet_name, manual, manual_bulk, keep_imp
 
     rows = cur.fetchall()
     to_enqueue = [(r[0], r[1]) for r in rows if r[1]]
-    queue_ids: list[int] = []
-    now = datetime.now().isoformat()
-    for meet_id, file_path in to_enqueue:
-        cur.execute(
-            "INSERT INTO parse_queue (meet_id, file_path, status, created_at, updated_at) VALUES (?, ?, 'queued', ?, ?)",
-            (meet_id, file_path, now, now),
-        )
-        conn.commit()
-        cur.execute("SELECT last_insert_rowid()")
-        qrow = cur.fetchone()
-        if qrow:
-            queue_ids.append(qrow[0])
+    queue_ids = enqueue_many(conn, to_enqueue)
 
     ingest_queue(conn)
 
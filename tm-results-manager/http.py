@@ -1,32 +1,66 @@
 # Python
+import functools
 import re
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from pathlib import Path
-from urllib.parse import urlparse, unquote, parse_qs
+from urllib.parse import urlparse, unquote
+
+# Content-Disposition: attachment; filename="..." / filename*=UTF-8''...
+CD_FILENAME_RE = re.compile(r'filename\*?=(?:UTF-8\'\')?"?([^\";]+)"?', re.IGNORECASE)
+
+# Fast path for ...?dn=<filename>&... URLs, avoiding urlparse/parse_qs
+DN_FAST_RE = re.compile(r"[?&]dn=([^&]+)")
+
+# One pooled keep-alive session for the whole process: repeated fetches to
+# the same host reuse the TCP+TLS connection instead of handshaking anew.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)
+    ),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
+def get_session() -> requests.Session:
+    """Return the shared pooled session (used by the downloader too)."""
+    return _session
 
 
 def fetch_page(url: str, timeout: float = 20.0) -> str | None:
     try:
-        r = requests.get(url, timeout=timeout)
+        # Ask for a compressed body explicitly; requests decodes transparently
+        r = _session.get(
+            url, timeout=timeout, headers={"Accept-Encoding": "gzip, deflate"}
+        )
         r.raise_for_status()
-        return r.text
+        # Decode explicitly; .text falls back to chardet-style detection when
+        # the Content-Type header omits a charset, which is slow on big pages
+        return r.content.decode(r.encoding or "utf-8", errors="replace")
     except requests.RequestException as e:
         print(f"Error fetching page: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def infer_filename_from_url(url: str) -> str:
     """
     Best-effort filename inference using dn= query param when present;
     otherwise from URL path basename. Falls back to 'download.zip'.
+
+    Cached: the same link is inspected during both the page parse and the
+    download phase, so repeat calls skip the regex/urlparse work.
     """
-    parsed = urlparse(url)
-    qs = parse_qs(parsed.query)
-    if "dn" in qs and qs["dn"]:
-        name = unquote(qs["dn"][0])
+    m = DN_FAST_RE.search(url)
+    if m:
+        name = unquote(m.group(1))
         if name:
             return name
-    name = unquote(Path(parsed.path).name)
+    name = unquote(Path(urlparse(url).path).name)
     return name or "download.zip"
 
 
@@ -38,9 +72,7 @@ def extract_filename_from_response_or_url(response, url: str) -> str:
         "content-disposition"
     )
     if cd:
-        m = re.search(
-            r'filename\*?=(?:UTF-8\'\')?"?([^\";]+)"?', cd, flags=re.IGNORECASE
-        )
+        m = CD_FILENAME_RE.search(cd)
         if m:
             return unquote(m.group(1))
     return infer_filename_from_url(url)
@@ -1,4 +1,5 @@
 # Python
+import re
 from bs4 import BeautifulSoup
 from typing import Dict, List
 from ..http import infer_filename_from_url
@@ -7,21 +8,37 @@ from ..storage.db import _iso_from_token
 
 PREFIX = "TM Results Files"
 
+# Fast path: date token inside the dn= query param, pulled out in one scan of
+# the raw URL instead of urlparse -> parse_qs -> unquote -> regex per link
+DN_DATE_RE = re.compile(r"[?&]dn=[^&]*?((0[1-9]|[12][0-9]|3[01])[A-Za-z]{3}\d{4})")
+
+# Prefer the C-backed lxml parser when available; html.parser is pure Python
+# and dominates scrape CPU time on the full community page.
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 
 def parse_meets(html: str) -> Dict[str, List[dict]]:
     """
     Parse meets and regions from the Swimming NZ community page.
     Scoped by h3 sections to avoid cross-region leakage.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    # Cheap pre-filter: skip building the parse tree entirely when the page
+    # has no TM Results sections or no TM File links at all
+    if PREFIX not in html or "TM File" not in html:
+        return {}
+
+    soup = BeautifulSoup(html, HTML_PARSER)
     regions: Dict[str, List[dict]] = {}
-    containers = soup.find_all(["section"])
-    PREFIX = "TM Results Files"
 
-    for container in containers:
-        h3 = container.find("h3")
-        if not h3:
-            continue
+    # One CSS selector pass for region headings instead of walking every
+    # section and probing it for an h3
+    for h3 in soup.select("section h3"):
+        container = h3.find_parent("section")
 
         heading = h3.get_text(strip=True)
         if "TM Results Files" not in heading:
@@ -38,40 +55,38 @@ def parse_meets(html: str) -> Dict[str, List[dict]]:
 
         regions.setdefault(region_name, [])
 
-        for a in container.find_all("a"):
-            text = a.get_text(strip=True)
-            if text != "TM File":
+        # soup-sieve pushes the text filter into the tree walk; the equality
+        # check stays as a safety net since :-soup-contains is a substring test
+        for a in container.select('a:-soup-contains("TM File")'):
+            if a.get_text(strip=True) != "TM File":
                 continue
 
             link = a.get("href")
             if not link:
                 continue
 
-            # Find meet name (same logic as before)
+            # Find meet name: one climb towards the container, stopping at the
+            # first ancestor card whose subtree holds a non-empty h1
             meet_name = None
-            parent = a
-            for _ in range(4):
-                if not parent or parent == container:
+            parent = a.parent
+            while parent is not None and parent is not container:
+                h1 = parent.find("h1")
+                if h1 and h1.get_text(strip=True):
+                    meet_name = h1.get_text(strip=True)
                     break
                 parent = parent.parent
-                if parent:
-                    h1 = parent.find("h1")
-                    if h1 and h1.get_text(strip=True):
-                        meet_name = h1.get_text(strip=True)
-                        break
-            if not meet_name:
-                card = a.find_parent(["article", "div", "section"])
-                if card and card != container:
-                    h1 = card.find("h1")
-                    if h1 and h1.get_text(strip=True):
-                        meet_name = h1.get_text(strip=True)
             if not meet_name:
                 continue
 
             # Early date extraction from dn/path, stripping trailing -NNN
-            orig_filename = infer_filename_from_url(link)
-            base_no_ext = base_name_without_ext_and_code(orig_filename)
-            date_token, year_int = extract_date_token(base_no_ext)
+            m = DN_DATE_RE.search(link)
+            if m:
+                date_token = m.group(1)
+                year_int = int(date_token[-4:])
+            else:
+                orig_filename = infer_filename_from_url(link)
+                base_no_ext = base_name_without_ext_and_code(orig_filename)
+                date_token, year_int = extract_date_token(base_no_ext)
             formatted_meet_date = _iso_from_token(date_token)
 
             regions[region_name].append(
@@ -2,19 +2,27 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-import io
 import json
 import zipfile
-import tempfile
-from datetime import datetime
+from datetime import date
 
 MODEL_PATH = Path(__file__).resolve().parents[1] / "models" / "hy3-results.json"
 TEAM_NAMES_PATH = Path(__file__).resolve().parents[1] / "models" / "team_names.json"
 REGION_CODES_PATH = Path(__file__).resolve().parents[1] / "models" / "region_codes.json"
 
 
-def _load_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+# orjson parses the model files a few times faster at import; fall back to
+# stdlib json when it is not installed, like the lxml/html.parser split
+try:
+    import orjson
+
+    def _load_json(path: Path) -> dict:
+        return orjson.loads(path.read_bytes())
+
+except ImportError:
+
+    def _load_json(path: Path) -> dict:
+        return json.loads(path.read_text(encoding="utf-8"))
 
 
 MODEL = _load_json(MODEL_PATH)
@@ -43,72 +51,125 @@ def _slice(line: str, start: Optional[int], length: Optional[int]) -> str:
     return line[i:j].rstrip()
 
 
+def _field_slice(field: dict) -> slice:
+    """Turn a {'start': 1-based, 'length': n} model field into a slice object."""
+    i = max(field["start"] - 1, 0)
+    return slice(i, i + field["length"])
+
+
+def _spec_slices(spec: dict, fields: Tuple[str, ...]) -> Dict[str, slice]:
+    return {f: _field_slice(spec[f]) for f in fields if f in spec}
+
+
+# Precomputed per-record-type slices: the parse loop runs over every line of
+# every archive, so the model dict walking and start/length arithmetic are
+# paid once at import instead of per field per line.
+MEET_SLICES = _spec_slices(
+    MODEL["meet_info"], ("name", "location", "meet_date_start", "meet_date_end")
+)
+MEET_EXT_SLICES = _spec_slices(
+    MODEL.get("meet_info_extended", {}), ("meet_type_code", "course_code")
+)
+TEAM_SLICES = _spec_slices(MODEL["team_info"], ("team_name",))
+TEAM_EXT_SLICES = _spec_slices(
+    MODEL.get("team_info_extended", {}),
+    ("address_1", "address_2", "city", "postal_code"),
+)
+SWIMMER_SLICES = _spec_slices(
+    MODEL["swimmer_info"],
+    ("gender", "last_name", "first_name", "mm_number", "birth_date"),
+)
+
+# Same treatment for the per-meet-type team overrides: mt code ->
+# (team_code slice, region_code slice, team_type)
+def _build_override_slices(team_spec: dict) -> Dict[str, Tuple[slice, slice, str]]:
+    out = {}
+    for mt, cfg in ((team_spec.get("overrides") or {}).get("meet_type") or {}).items():
+        tc = cfg.get("team_code") or {}
+        rc = cfg.get("region_code") or {}
+        # start/length may be null in the model (e.g. no region code for
+        # school meet types); an empty slice yields "" just like _slice did
+        out[mt] = (
+            _field_slice(tc) if tc.get("start") is not None else slice(0, 0),
+            _field_slice(rc) if rc.get("start") is not None else slice(0, 0),
+            cfg.get("team_type", "Other"),
+        )
+    return out
+
+
+TEAM_OVERRIDE_SLICES = _build_override_slices(MODEL["team_info"])
+
+# Meet type codes that denote school meets (no region attribution for teams)
+_SCHOOL_MEET_TYPES = frozenset(("03", "04"))
+
+
+# Digit offsets of (year, month, day) within each 8-char date token
+_DATE_FMT_SLICES = {
+    "MMDDYYYY": (slice(4, 8), slice(0, 2), slice(2, 4)),
+    "DDMMYYYY": (slice(4, 8), slice(2, 4), slice(0, 2)),
+    "YYYYMMDD": (slice(0, 4), slice(4, 6), slice(6, 8)),
+}
+
+
 def _parse_date_token(s: str, fmt: str) -> Optional[str]:
     s = s.strip()
     if not s:
         return None
-    fmts = {
-        "MMDDYYYY": "%m%d%Y",
-        "DDMMYYYY": "%d%m%Y",
-        "YYYYMMDD": "%Y%m%d",
-    }
-    py_fmt = fmts.get(fmt)
-    if not py_fmt:
+    parts = _DATE_FMT_SLICES.get(fmt)
+    if not parts or len(s) != 8 or not s.isdigit():
         return None
+    # Slice the digits directly; strptime's format machinery is far slower
+    # and these three layouts are the whole closed set. date() still
+    # validates ranges (month 13, Feb 30, ...) like strptime did.
     try:
-        dt = datetime.strptime(s, py_fmt).date()
-        return dt.isoformat()
+        return date(int(s[parts[0]]), int(s[parts[1]]), int(s[parts[2]])).isoformat()
     except ValueError:
         return None
 
 
 def _reformat_date(date_iso: Optional[str], to_fmt: str) -> Optional[str]:
-    if not date_iso:
-        return None
-    try:
-        d = datetime.fromisoformat(date_iso).date()
-        if to_fmt == "DDMMYYYY":
-            return d.strftime("%d%m%Y")
-        if to_fmt == "MMDDYYYY":
-            return d.strftime("%m%d%Y")
-        if to_fmt == "YYYYMMDD":
-            return d.strftime("%Y%m%d")
-    except Exception:
+    # date_iso is always our own YYYY-MM-DD output, so plain slicing beats
+    # a fromisoformat/strftime round-trip through datetime objects
+    if not date_iso or len(date_iso) != 10:
         return None
+    y, m, d = date_iso[0:4], date_iso[5:7], date_iso[8:10]
+    if to_fmt == "DDMMYYYY":
+        return d + m + y
+    if to_fmt == "MMDDYYYY":
+        return m + d + y
+    if to_fmt == "YYYYMMDD":
+        return y + m + d
     return None
 
 
-def _detect_team_type_from_name(
-    name: str, detection_map: Dict[str, str]
-) -> Optional[str]:
+# Needles lowercased once at import; the per-team hot path then pays one
+# .lower() on the team name plus C-level substring tests
+_DETECTION_MAP = TEAM_NAMES.get("team_name_detection", {})
+DETECTION_LIST = [
+    (needle.lower(), team_type)
+    for needle, team_type in _DETECTION_MAP.items()
+    if needle and needle != "default"
+]
+DETECTION_DEFAULT = _DETECTION_MAP.get("default")
+
+
+def _detect_team_type_from_name(name: str) -> Optional[str]:
     n = (name or "").lower()
-    for needle, team_type in detection_map.items():
-        if needle and needle.lower() in n:
+    for needle, team_type in DETECTION_LIST:
+        if needle in n:
             return team_type
-    return detection_map.get("default")
-
+    return DETECTION_DEFAULT
 
-def _apply_team_overrides(
-    line: str, meet_type_code: str, team_spec: dict, detection_map: Dict[str, str]
-) -> Tuple[str, str, str]:
-    # Returns (team_code, region_code, team_type)
-    overrides = (team_spec.get("overrides") or {}).get("meet_type", {})
-    mt = meet_type_code or ""
-    cfg = overrides.get(mt, overrides.get("fallback", {}))
 
-    team_code = _slice(
-        line,
-        cfg.get("team_code", {}).get("start"),
-        cfg.get("team_code", {}).get("length"),
+def _apply_team_overrides(line: str, meet_type_code: str) -> Tuple[str, str, str]:
+    # Returns (team_code, region_code, team_type) via precomputed slices
+    cfg = TEAM_OVERRIDE_SLICES.get(
+        meet_type_code or "", TEAM_OVERRIDE_SLICES.get("fallback")
     )
-    region_code = _slice(
-        line,
-        cfg.get("region_code", {}).get("start"),
-        cfg.get("region_code", {}).get("length"),
-    )
-    team_type = cfg.get("team_type", "Other")
-
-    return team_code, region_code, team_type
+    if cfg is None:
+        return "", "", "Other"
+    tc_slice, rc_slice, team_type = cfg
+    return line[tc_slice].rstrip(), line[rc_slice].rstrip(), team_type
 
 
 def parse_hy3_lines(
@@ -131,13 +192,23 @@ def parse_hy3_lines(
     team_info_spec = MODEL["team_info"]
     team_ext_spec = MODEL.get("team_info_extended", {})
     swimmer_spec = MODEL["swimmer_info"]
-    detection_map = TEAM_NAMES.get("team_name_detection", {})
 
     meet_type_code = ""
     meet_type_map = meet_ext_spec.get("meet_type") or {}
     meet_type_fallback = meet_ext_spec.get("meet_type_fallback", "Other")
     course_map = meet_ext_spec.get("course") or {}
 
+    # Hoist per-line lookups to locals: record tags and the date format are
+    # loop-invariant, and LOAD_FAST beats chained dict subscripts in the
+    # hottest loop of the ingest path
+    mi_tag = meet_info_spec["row_identifier"]
+    me_tag = meet_ext_spec.get("row_identifier")
+    ti_tag = team_info_spec["row_identifier"]
+    te_tag = team_ext_spec.get("row_identifier")
+    sw_tag = swimmer_spec["row_identifier"]
+    src_fmt = meet_info_spec.get("date_format", "MMDDYYYY")
+    birth_fmt = swimmer_spec.get("birth_date_format", "MMDDYYYY")
+
     current_team: Optional[dict] = None
 
     for raw in lines:
@@ -147,34 +218,17 @@ def parse_hy3_lines(
 
         rec = line[:2]  # HY3 row_identifier are 2 chars in your JSON (B1,B2,C1,C2,D1)
 
-        if rec == meet_info_spec["row_identifier"]:
+        if rec == mi_tag:
             # Meet info core
-            name = _slice(
-                line, meet_info_spec["name"]["start"], meet_info_spec["name"]["length"]
-            )
-            location = _slice(
-                line,
-                meet_info_spec["location"]["start"],
-                meet_info_spec["location"]["length"],
-            )
+            name = line[MEET_SLICES["name"]].rstrip()
+            location = line[MEET_SLICES["location"]].rstrip()
 
             # Parse source dates as per model, then reformat to DDMMYYYY
-            src_fmt = meet_info_spec.get("date_format", "MMDDYYYY")
             date_start_iso = _parse_date_token(
-                _slice(
-                    line,
-                    meet_info_spec["meet_date_start"]["start"],
-                    meet_info_spec["meet_date_start"]["length"],
-                ),
-                src_fmt,
+                line[MEET_SLICES["meet_date_start"]].rstrip(), src_fmt
             )
             date_end_iso = _parse_date_token(
-                _slice(
-                    line,
-                    meet_info_spec["meet_date_end"]["start"],
-                    meet_info_spec["meet_date_end"]["length"],
-                ),
-                src_fmt,
+                line[MEET_SLICES["meet_date_end"]].rstrip(), src_fmt
             )
 
             meet_date_start = _reformat_date(date_start_iso, "DDMMYYYY")
@@ -190,20 +244,12 @@ def parse_hy3_lines(
                 }
             )
 
-        elif rec == meet_ext_spec.get("row_identifier"):
+        elif rec == me_tag:
             # Meet info extended
-            mt_code = _slice(
-                line,
-                meet_ext_spec["meet_type_code"]["start"],
-                meet_ext_spec["meet_type_code"]["length"],
-            )
+            mt_code = line[MEET_EXT_SLICES["meet_type_code"]].rstrip()
             meet_type_code = mt_code
             meet_type = meet_type_map.get(mt_code, meet_type_fallback)
-            course_code = _slice(
-                line,
-                meet_ext_spec["course_code"]["start"],
-                meet_ext_spec["course_code"]["length"],
-            )
+            course_code = line[MEET_EXT_SLICES["course_code"]].rstrip()
             course = course_map.get(course_code, "")
 
             meet.update(
@@ -215,63 +261,49 @@ def parse_hy3_lines(
                 }
             )
 
-        elif rec == team_info_spec["row_identifier"]:
-            team_name = _slice(
-                line,
-                team_info_spec["team_name"]["start"],
-                team_info_spec["team_name"]["length"],
-            ).strip()
+        elif rec == ti_tag:
+            team_name = line[TEAM_SLICES["team_name"]].strip()
 
             team_code, region_code, team_type = _apply_team_overrides(
-                line, meet_type_code, team_info_spec, detection_map
+                line, meet_type_code
             )
 
             # Safety override: if meet_type not 03/04 but name looks like school-ish, blank region_code
-            name_type = _detect_team_type_from_name(team_name, detection_map)
+            name_type = _detect_team_type_from_name(team_name)
 
-            if name_type in ("High School", "College") and meet.get(
-                "meet_type_code"
-            ) not in ("03", "04"):
+            is_school_meet = meet.get("meet_type_code") in _SCHOOL_MEET_TYPES
+            if name_type in ("High School", "College") and not is_school_meet:
                 region_code = ""
 
             # If meet type explicitly school types, blank region_code
-            if meet.get("meet_type_code") in ("03", "04"):
+            if is_school_meet:
                 region_code = ""
 
+            # Normalize once; the slice already rstripped, so only the
+            # uppercase remains, and the same string serves both the lookup
+            # and the stored code
+            region_code = region_code.strip().upper() if region_code else ""
+
             # Resolve region name via region_codes.json
-            region_name = REGION_BY_CODE.get((region_code or "").strip().upper(), "")
+            region_name = REGION_BY_CODE.get(region_code, "")
 
             current_team = {
                 "team_code": team_code,
                 "team_name": team_name,
                 "team_type": name_type or team_type,
-                "region_code": region_code or "",
+                "region_code": region_code,
                 "region": region_name,
             }
             teams.append(current_team)
 
-        elif rec == team_ext_spec.get("row_identifier") and teams:
+        elif rec == te_tag and teams:
             # Optional; extend last team with extra info
             t = teams[-1]
-            t["address_1"] = _slice(
-                line,
-                team_ext_spec["address_1"]["start"],
-                team_ext_spec["address_1"]["length"],
-            ).strip()
-            t["address_2"] = _slice(
-                line,
-                team_ext_spec["address_2"]["start"],
-                team_ext_spec["address_2"]["length"],
-            ).strip()
-            t["city"] = _slice(
-                line, team_ext_spec["city"]["start"], team_ext_spec["city"]["length"]
-            ).strip()
-            t["postal_code"] = _slice(
-                line,
-                team_ext_spec["postal_code"]["start"],
-                team_ext_spec["postal_code"]["length"],
-            ).strip()
-        elif rec == swimmer_spec["row_identifier"]:
+            t["address_1"] = line[TEAM_EXT_SLICES["address_1"]].strip()
+            t["address_2"] = line[TEAM_EXT_SLICES["address_2"]].strip()
+            t["city"] = line[TEAM_EXT_SLICES["city"]].strip()
+            t["postal_code"] = line[TEAM_EXT_SLICES["postal_code"]].strip()
+        elif rec == sw_tag:
             if not teams:
                 warnings.append(
                     {
@@ -282,30 +314,11 @@ def parse_hy3_lines(
                 )
                 continue
 
-            gender = _slice(
-                line, swimmer_spec["gender"]["start"], swimmer_spec["gender"]["length"]
-            ).strip()
-            last_name = _slice(
-                line,
-                swimmer_spec["last_name"]["start"],
-                swimmer_spec["last_name"]["length"],
-            ).strip()
-            first_name = _slice(
-                line,
-                swimmer_spec["first_name"]["start"],
-                swimmer_spec["first_name"]["length"],
-            ).strip()
-            mm_number = _slice(
-                line,
-                swimmer_spec["mm_number"]["start"],
-                swimmer_spec["mm_number"]["length"],
-            ).strip()
-            birth_date_src = _slice(
-                line,
-                swimmer_spec["birth_date"]["start"],
-                swimmer_spec["birth_date"]["length"],
-            ).strip()
-            birth_fmt = swimmer_spec.get("birth_date_format", "MMDDYYYY")
+            gender = line[SWIMMER_SLICES["gender"]].strip()
+            last_name = line[SWIMMER_SLICES["last_name"]].strip()
+            first_name = line[SWIMMER_SLICES["first_name"]].strip()
+            mm_number = line[SWIMMER_SLICES["mm_number"]].strip()
+            birth_date_src = line[SWIMMER_SLICES["birth_date"]].strip()
             birth_iso = _parse_date_token(birth_date_src, birth_fmt)
             birth_ddmmyyyy = _reformat_date(birth_iso, "DDMMYYYY") if birth_iso else ""
 
@@ -375,16 +388,10 @@ def parse_hy3_zip(
 
         hy3_name = hy3_files[0]
 
-        with tempfile.TemporaryDirectory(prefix="hy3_") as tmpdir:
-            tmp = Path(tmpdir)
-            # Extract only the chosen hy3 and optional cl2 for debugging
-            zf.extract(hy3_name, tmp)
-            if cl2_files:
-                zf.extract(cl2_files[0], tmp)
-
-            hy3_path = tmp / hy3_name
-            content = hy3_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-            meet, teams, swimmers, warn2 = parse_hy3_lines(content)
-            warnings.extend(warn2)
+        # Decode the member straight from the archive; extracting to a
+        # temporary directory cost a full write+read round-trip per zip
+        content = zf.read(hy3_name).decode("utf-8", errors="ignore").splitlines()
+        meet, teams, swimmers, warn2 = parse_hy3_lines(content)
+        warnings.extend(warn2)
 
-            return meet, teams, swimmers, warnings
+        return meet, teams, swimmers, warnings
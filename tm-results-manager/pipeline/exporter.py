@@ -1,8 +1,7 @@
 # Python
-import pandas as pd
+import csv
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List
+from ..storage.db import _pretty_from_iso
 
 COLUMNS = [
     "region",
@@ -20,53 +19,56 @@ COLUMNS = [
 ]
 
 
-def export_to_csv(regions: Dict[str, List[dict]], log_data, csv_file: str):
-    """Export meet data to CSV, merging with DB log where relevant."""
-    rows = []
-    for region, meets in regions.items():
-        for meet in meets:
-            log_entry = log_data.get(region, {}).get(meet["meet_name"], {})
-            meet_date = (
-                _pretty_from_iso(meet["meet_date"])
-                if meet.get("meet_date")
-                else _pretty_from_iso(log_entry.get("meet_date"))
-            )
-            rows.append(
-                {
-                    "region": region,
-                    "meet_name": meet["meet_name"],
-                    "link": meet["link"],
-                    "meet_date": meet_date,
-                    "meet_year": meet.get("meet_year", log_entry.get("meet_year")),
-                    "location": meet.get("location", log_entry.get("location")),
-                    "course": meet.get("course", log_entry.get("course")),
-                    "processed_timestamp": log_entry.get(
-                        "processed_timestamp", datetime.now().isoformat()
-                    ),
-                    "downloaded": log_entry.get("downloaded", False),
-                    "file_path": log_entry.get("file_path"),
-                    "uploaded": log_entry.get("uploaded", False),
-                    "processed_by_target": log_entry.get("processed_by_target", False),
-                }
-            )
-
-    df = pd.DataFrame(rows)
-    for col in COLUMNS:
-        if col not in df.columns:
-            df[col] = None
-    df = df[COLUMNS]
-
+def export_to_csv(conn, csv_file: str):
+    """
+    Export all meets to CSV, streamed straight from SQLite.
+    Deduplication is already enforced by the meets table constraints, so no
+    read-merge pass over an existing CSV is needed.
+    """
     csv_path = Path(csv_file)
-    if csv_path.exists():
-        existing = pd.read_csv(csv_path)
-        for col in COLUMNS:
-            if col not in existing.columns:
-                existing[col] = None
-        combined = pd.concat(
-            [existing[COLUMNS], df], ignore_index=True
-        ).drop_duplicates(subset=["region", "meet_name"], keep="last")
-    else:
-        combined = df
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT region, meet_name, url, meet_date, meet_year, location, course,
+               processed_timestamp, downloaded, file_path, uploaded, processed_by_target
+        FROM meets
+        ORDER BY region, meet_name
+        """
+    )
+
+    with csv_path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for row in cur:
+            (
+                region,
+                meet_name,
+                url,
+                meet_date,
+                meet_year,
+                location,
+                course,
+                processed_timestamp,
+                downloaded,
+                file_path,
+                uploaded,
+                processed_by_target,
+            ) = row
+            writer.writerow(
+                [
+                    region,
+                    meet_name,
+                    url,
+                    _pretty_from_iso(meet_date),
+                    meet_year,
+                    location,
+                    course,
+                    processed_timestamp,
+                    bool(downloaded),
+                    file_path,
+                    bool(uploaded),
+                    bool(processed_by_target),
+                ]
+            )
 
-    combined.to_csv(csv_path, index=False)
     print(f"Exported data to {csv_path}")
@@ -1,13 +1,20 @@
 # Python
 from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from ..parsing.hy3_parser import parse_hy3_zip
 from ..storage import db as dbmod
 
 
-def ingest_zip(conn, zip_path: str, meet_row: Optional[dict] = None) -> None:
+def ingest_zip(
+    conn,
+    zip_path: str,
+    meet_row: Optional[dict] = None,
+    parsed: Optional[Tuple] = None,
+) -> None:
     if not meet_row:
         # No meet record to attach results to; log and bail
         dbmod.log_error(
@@ -19,7 +26,11 @@ def ingest_zip(conn, zip_path: str, meet_row: Optional[dict] = None) -> None:
         )
         return
 
-    meet, teams, swimmers, warnings = parse_hy3_zip(Path(zip_path))
+    # Accept a pre-parsed result (from the worker pool in ingest_queue);
+    # parse here only when called standalone
+    if parsed is None:
+        parsed = parse_hy3_zip(Path(zip_path))
+    meet, teams, swimmers, warnings = parsed
 
     if not meet:
         for w in warnings:
@@ -55,28 +66,67 @@ def ingest_zip(conn, zip_path: str, meet_row: Optional[dict] = None) -> None:
     dbmod.mark_parsed(conn, meet_row["id"])
 
 
+def _ingest_one(conn, item: dict, parsed: Optional[Tuple] = None) -> None:
+    try:
+        dbmod.update_parse_queue_status(conn, item["id"], "processing")
+
+        ingest_zip(
+            conn,
+            item["file_path"],
+            meet_row=dbmod.get_meet_by_id(conn, item["meet_id"]),
+            parsed=parsed,
+        )
+        dbmod.update_parse_queue_status(conn, item["id"], "done")
+    except Exception as e:
+        dbmod.update_parse_queue_status(conn, item["id"], "error", str(e))
+
+        dbmod.log_error(
+            conn,
+            file_path=item["file_path"],
+            meet_id=item["meet_id"],
+            error_type="IngestError",
+            message=str(e),
+            context=None,
+        )
+
+
 def ingest_queue(conn) -> None:
-    """Process parse_queue sequentially."""
-    items = dbmod.get_parse_queue(conn)
+    """Process parse_queue: parse in parallel, write sequentially.
 
-    for item in items:
-        try:
-            dbmod.update_parse_queue_status(conn, item["id"], "processing")
+    HY3 parsing is CPU-bound and independent per zip, so it fans out over a
+    process pool; the SQLite connection stays on this thread and consumes
+    parsed results as they complete.
+    """
+    items = dbmod.get_parse_queue(conn)
+    if not items:
+        return
 
-            ingest_zip(
-                conn,
-                item["file_path"],
-                meet_row=dbmod.get_meet_by_id(conn, item["meet_id"]),
-            )
-            dbmod.update_parse_queue_status(conn, item["id"], "done")
-        except Exception as e:
-            dbmod.update_parse_queue_status(conn, item["id"], "error", str(e))
+    if len(items) == 1:
+        # Not worth spawning workers for a single zip
+        _ingest_one(conn, items[0])
+        dbmod.flush_errors(conn)
+        return
 
-            dbmod.log_error(
-                conn,
-                file_path=item["file_path"],
-                meet_id=item["meet_id"],
-                error_type="IngestError",
-                message=str(e),
-                context=None,
-            )
+    max_workers = min(os.cpu_count() or 1, len(items))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(parse_hy3_zip, Path(item["file_path"])): item
+            for item in items
+        }
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                parsed = future.result()
+            except Exception as e:
+                dbmod.update_parse_queue_status(conn, item["id"], "error", str(e))
+                dbmod.log_error(
+                    conn,
+                    file_path=item["file_path"],
+                    meet_id=item["meet_id"],
+                    error_type="IngestError",
+                    message=str(e),
+                    context=None,
+                )
+                continue
+            _ingest_one(conn, item, parsed=parsed)
+    dbmod.flush_errors(conn)
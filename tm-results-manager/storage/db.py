@@ -1,18 +1,103 @@
 # Python
+import atexit
+import functools
 import sqlite3
+import hashlib
 import json
-import time
-from datetime import datetime
+import weakref
+from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from ..config import DB_FILE
 
 BUSY_TIMEOUT_MS = 5000
 
+# Bumped whenever init_db's schema DDL changes; lets reopened databases skip
+# the full CREATE/ALTER replay on every CLI invocation
+SCHEMA_VERSION = 5
+
+# SQLite caps bound parameters at 999 per statement; with 13 columns per meet
+# row that allows at most 76 rows per multi-row VALUES upsert.
+UPSERT_CHUNK_SIZE = 70
+
+# Pending error_log rows buffer at most this many entries per connection;
+# flush_errors runs once the buffer fills, at the end of ingest, and at
+# interpreter exit
+ERROR_BUFFER_LIMIT = 256
+_BUFFERED_CONNECTIONS: "weakref.WeakSet" = weakref.WeakSet()
+_ERROR_INSERT_SQL = """INSERT INTO error_log (timestamp, file_path, meet_id, region, error_type, message, context_json)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+
+class Connection(sqlite3.Connection):
+    """sqlite3.Connection that can carry the error buffer as an attribute.
+
+    The base class rejects attribute assignment and weak references, both of
+    which the buffered log_error path relies on.
+    """
+
+    _error_buf: list
+
+# orjson serializes error-log context dicts noticeably faster than the stdlib;
+# both paths emit compact JSON without the default ", " separators
+try:
+    import orjson
+
+    def _dumps_context(context: dict) -> str:
+        return orjson.dumps(context).decode("utf-8")
+
+except ImportError:
+
+    def _dumps_context(context: dict) -> str:
+        return json.dumps(context, separators=(",", ":"))
+
+
+
+def _meet_content_hash(region, meet_name, url, meet) -> str:
+    """Stable short hash of the scraped meet fields, used to skip no-op upserts."""
+    key = "|".join(
+        str(v)
+        for v in (
+            region,
+            meet_name,
+            url,
+            meet.get("meet_date"),
+            meet.get("meet_year"),
+            meet.get("location"),
+            meet.get("course"),
+        )
+    )
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _chunked(rows: list, n: int):
+    for i in range(0, len(rows), n):
+        yield rows[i : i + n]
+
+
+def _ensure_column(cur, table: str, column: str, decl: str):
+    """Add a column to an existing table if it is not there yet."""
+    cols = {row[1] for row in cur.execute(f"PRAGMA table_info({table})")}
+    if column not in cols:
+        cur.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
 
 def init_db(db_path: str = DB_FILE):
-    conn = sqlite3.connect(db_path)
+    # Larger statement cache than the default 128: ingest cycles through the
+    # long upsert/merge statements plus every per-table helper, and a cache
+    # miss re-parses the SQL
+    conn = sqlite3.connect(db_path, cached_statements=256, factory=Connection)
     conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    # Bulk-ingest friendly defaults: in-memory temp tables, 64 MB page cache,
+    # 256 MB mmap window for reads
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    # Schema already current: skip the DDL replay below
+    if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+        return conn
     cur = conn.cursor()
     # Existing meets table created elsewhere in your project — ensure new columns exist
     cur.execute(
@@ -23,17 +108,20 @@ def init_db(db_path: str = DB_FILE):
             meet_name TEXT NOT NULL,
             url TEXT NOT NULL,
             processed_timestamp TEXT NOT NULL,
-            downloaded BOOLEAN DEFAULT FALSE,
+            downloaded INTEGER NOT NULL DEFAULT 0,
             file_path TEXT,
-            uploaded BOOLEAN DEFAULT FALSE,
-            processed_by_target BOOLEAN DEFAULT FALSE,
+            uploaded INTEGER NOT NULL DEFAULT 0,
+            processed_by_target INTEGER NOT NULL DEFAULT 0,
             meet_date TEXT,
             meet_year INTEGER,
             location TEXT,
             course TEXT,
             meet_date_start TEXT,
             meet_date_end TEXT,
-            parsed BOOLEAN DEFAULT FALSE
+            parsed INTEGER NOT NULL DEFAULT 0,
+            etag TEXT,
+            last_modified TEXT,
+            content_hash TEXT
         )
         """
     )
@@ -45,6 +133,24 @@ def init_db(db_path: str = DB_FILE):
     cur.execute(
         "CREATE UNIQUE INDEX IF NOT EXISTS ux_meets_file_path ON meets(file_path)"
     )
+    # Point lookups by (region, meet_name) back the lazy meet log view
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_meets_region_name ON meets(region, meet_name)"
+    )
+    # parse-files filters meets by downloaded/parsed state
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_meets_downloaded_parsed ON meets(downloaded, parsed)"
+    )
+    # Normalize legacy NULL parsed flags so queries can use plain equality,
+    # and keep a partial index sized to the unparsed backlog
+    cur.execute("UPDATE meets SET parsed=0 WHERE parsed IS NULL")
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_meets_unparsed ON meets(downloaded) WHERE parsed=0"
+    )
+    # HTTP cache validators for conditional re-downloads
+    _ensure_column(cur, "meets", "etag", "TEXT")
+    _ensure_column(cur, "meets", "last_modified", "TEXT")
+    _ensure_column(cur, "meets", "content_hash", "TEXT")
 
     cur.execute(
         """
@@ -64,12 +170,10 @@ def init_db(db_path: str = DB_FILE):
         """
     )
 
-    cur.execute(
-        """
-        CREATE UNIQUE INDEX IF NOT EXISTS ux_teams_identity
-        ON teams (team_code, team_name)
-        """
-    )
+    # The inline UNIQUE(team_code, team_name) already creates the implicit
+    # unique index; the old explicit duplicate just doubled write cost on
+    # every team upsert. Drop it from existing databases.
+    cur.execute("DROP INDEX IF EXISTS ux_teams_identity")
 
     cur.execute(
         """
@@ -152,6 +256,15 @@ def init_db(db_path: str = DB_FILE):
         )
         """
     )
+    # Small key/value store for scraper state (page hash, cached parse, ...)
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value BLOB
+        )
+        """
+    )
     cur.execute(
         """
         CREATE TABLE IF NOT EXISTS error_log (
@@ -168,46 +281,87 @@ def init_db(db_path: str = DB_FILE):
         """
     )
 
+    # Point lookups used by the CLI summaries: newest error_log rows per meet
+    # and parse_queue counts by status
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_error_log_meet_id ON error_log(meet_id, id DESC)"
+    )
+    # Partial: get_parse_queue only ever polls pending statuses, and entries
+    # fall out of the index as they move to done/error, so it stays tiny no
+    # matter how much history parse_queue accumulates. Rowid follows status in
+    # the index, so the ORDER BY id comes out of the scan for free.
+    cur.execute("DROP INDEX IF EXISTS idx_parse_queue_status")
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_parse_queue_pending "
+        "ON parse_queue(status) WHERE status IN ('queued','retry')"
+    )
+    # Dedupe guard for the enqueue helpers: re-enqueueing an item that is
+    # still pending becomes an ignored no-op instead of a duplicate job
+    cur.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_parse_queue_pending "
+        "ON parse_queue(meet_id, file_path) WHERE status IN ('queued','retry')"
+    )
+    # Foreign-key lookups without a covering left-prefix elsewhere:
+    # merge_meets repoints parse_queue.meet_id, and link_meet_teams_swimmers
+    # selects swimmers by team presence. The meet_* link tables already get
+    # meet_id as the left prefix of their UNIQUE constraints.
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_parse_queue_meet_id ON parse_queue(meet_id)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_swimmers_team_id ON swimmers(team_id)"
+    )
+
+    cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    # Populate sqlite_stat1 so the planner actually picks the new indexes;
+    # only runs on the schema-build path, not on the user_version fast path
+    cur.execute("ANALYZE")
     conn.commit()
     return conn
 
 
 # Python
-def load_log(conn):
-    """
-    Load existing meets into a nested dict: region -> meet_name -> metadata.
-    Matches the structure expected by exporter and downloader.
-    """
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT region, meet_name, url, processed_timestamp, downloaded, file_path,
-               uploaded, processed_by_target, meet_date, meet_year, location, course,
-               meet_date_start, meet_date_end, parsed
-        FROM meets
-        """
-    )
-    rows = cur.fetchall()
-    log_data = {}
-    for (
-        region,
-        meet_name,
-        url,
-        processed,
-        downloaded,
-        file_path,
-        uploaded,
-        processed_by_target,
-        meet_date,
-        meet_year,
-        location,
-        course,
-        meet_date_start,
-        meet_date_end,
-        parsed,
-    ) in rows:
-        log_data.setdefault(region, {})
-        log_data[region][meet_name] = {
+class _RegionLogView:
+    """Lazy meet_name -> metadata lookups for one region."""
+
+    def __init__(self, conn, region):
+        self._conn = conn
+        self._region = region
+
+    def get(self, meet_name, default=None):
+        cur = self._conn.cursor()
+        cur.execute(
+            """
+            SELECT url, processed_timestamp, downloaded, file_path,
+                   uploaded, processed_by_target, meet_date, meet_year, location,
+                   course, meet_date_start, meet_date_end, parsed, etag,
+                   last_modified
+            FROM meets
+            WHERE region = ? AND meet_name = ?
+            """,
+            (self._region, meet_name),
+        )
+        row = cur.fetchone()
+        if not row:
+            return default
+        (
+            url,
+            processed,
+            downloaded,
+            file_path,
+            uploaded,
+            processed_by_target,
+            meet_date,
+            meet_year,
+            location,
+            course,
+            meet_date_start,
+            meet_date_end,
+            parsed,
+            etag,
+            last_modified,
+        ) = row
+        return {
             "url": url,
             "processed_timestamp": processed,
             "downloaded": downloaded,
@@ -220,9 +374,33 @@ def load_log(conn):
             "course": course,
             "meet_date_start": meet_date_start,
             "meet_date_end": meet_date_end,
-            "parsed": bool(parsed),
+            # 0/1 like the other flag columns; callers only test truthiness
+            "parsed": parsed,
+            "etag": etag,
+            "last_modified": last_modified,
         }
-    return log_data
+
+
+class MeetLogView:
+    """
+    Lazy region -> meet_name -> metadata view over the meets table.
+    Supports the nested .get(...) access pattern used by the exporter and
+    downloader without materializing every row up front.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def get(self, region, default=None):
+        return _RegionLogView(self._conn, region)
+
+
+def load_log(conn):
+    """
+    Return a lazy view of existing meets: region -> meet_name -> metadata.
+    Lookups hit idx_meets_region_name instead of loading the whole table.
+    """
+    return MeetLogView(conn)
 
 
 def update_log(conn, regions, downloaded_files=None):
@@ -235,24 +413,34 @@ def update_log(conn, regions, downloaded_files=None):
         downloaded_files = {}
     cur = conn.cursor()
     now = datetime.now().isoformat()
-    # Python
 
-    def _find_meet_by_file_path(conn, file_path: str):
-        cur = conn.cursor()
-        cur.execute("SELECT id, url FROM meets WHERE file_path = ?", (file_path,))
-        return cur.fetchone()  # (id, url) or None
+    # Prefetch collision candidates in one query instead of a SELECT per
+    # downloaded meet: file_path -> (id, url)
+    existing_by_path = {}
+    file_paths = [fp for fp in downloaded_files.values() if fp]
+    if file_paths:
+        qmarks = ",".join(["?"] * len(file_paths))
+        cur.execute(
+            f"SELECT file_path, id, url FROM meets WHERE file_path IN ({qmarks})",
+            file_paths,
+        )
+        existing_by_path = {fp: (mid, url) for fp, mid, url in cur.fetchall()}
+
+    # Collect upsert rows so they can be issued with a single executemany below;
+    # file_path collisions still need individual handling and are resolved first.
+    upsert_rows = []
 
     for region, meets in regions.items():
         for meet in meets:
             meet_name = meet["meet_name"]
             file_path = downloaded_files.get(meet_name)
             # print(f"Updating log for meet: {meet_name}, file_path={file_path}")
-            downloaded = file_path is not None
+            downloaded = int(file_path is not None)
             url = meet["link"]
 
             # If we have a file_path, ensure we don't collide with existing row
             if downloaded and file_path:
-                found = _find_meet_by_file_path(conn, file_path)
+                found = existing_by_path.get(file_path)
                 if found:
                     # print(found)
                     existing_id, existing_url = found
@@ -299,26 +487,7 @@ def update_log(conn, regions, downloaded_files=None):
 
                         continue
 
-            # Normal upsert by URL
-            cur.execute(
-                """
-                INSERT INTO meets 
-                (region, meet_name, url, processed_timestamp, downloaded, file_path, uploaded, processed_by_target,
-                meet_date, meet_year, location, course)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(url) DO UPDATE SET
-                region=excluded.region,
-                meet_name=excluded.meet_name,
-                processed_timestamp=excluded.processed_timestamp,
-                downloaded=excluded.downloaded OR meets.downloaded,
-                file_path=COALESCE(excluded.file_path, meets.file_path),
-                uploaded=meets.uploaded,
-                processed_by_target=meets.processed_by_target,
-                meet_date=COALESCE(excluded.meet_date, meets.meet_date),
-                meet_year=COALESCE(excluded.meet_year, meets.meet_year),
-                location=COALESCE(excluded.location, meets.location),
-                course=COALESCE(excluded.course, meets.course)
-                """,
+            upsert_rows.append(
                 (
                     region,
                     meet_name,
@@ -326,30 +495,82 @@ def update_log(conn, regions, downloaded_files=None):
                     now,
                     downloaded,
                     file_path,
-                    False,
-                    False,
+                    0,
+                    0,
                     meet.get("meet_date"),
                     meet.get("meet_year"),
                     meet.get("location"),
                     meet.get("course"),
-                ),
+                    _meet_content_hash(region, meet_name, url, meet),
+                )
+            )
+
+    # Normal upserts by URL, batched as multi-row VALUES to amortize
+    # statement dispatch (one execute per UPSERT_CHUNK_SIZE rows)
+    upsert_tail = """
+        ON CONFLICT(url) DO UPDATE SET
+        region=excluded.region,
+        meet_name=excluded.meet_name,
+        processed_timestamp=excluded.processed_timestamp,
+        downloaded=excluded.downloaded OR meets.downloaded,
+        file_path=COALESCE(excluded.file_path, meets.file_path),
+        uploaded=meets.uploaded,
+        processed_by_target=meets.processed_by_target,
+        meet_date=COALESCE(excluded.meet_date, meets.meet_date),
+        meet_year=COALESCE(excluded.meet_year, meets.meet_year),
+        location=COALESCE(excluded.location, meets.location),
+        course=COALESCE(excluded.course, meets.course),
+        content_hash=excluded.content_hash
+        WHERE meets.content_hash IS NOT excluded.content_hash
+           OR (excluded.downloaded AND NOT meets.downloaded)
+        """
+    # One explicit transaction for all chunks, so the whole upsert batch
+    # costs a single commit regardless of size
+    with conn:
+        for chunk in _chunked(upsert_rows, UPSERT_CHUNK_SIZE):
+            placeholders = ",".join(
+                ["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk)
+            )
+            cur.execute(
+                """
+                INSERT INTO meets
+                (region, meet_name, url, processed_timestamp, downloaded, file_path, uploaded, processed_by_target,
+                meet_date, meet_year, location, course, content_hash)
+                VALUES """
+                + placeholders
+                + upsert_tail,
+                [param for row in chunk for param in row],
             )
 
+
+def get_meta(conn, key: str):
+    cur = conn.cursor()
+    cur.execute("SELECT value FROM meta WHERE key=?", (key,))
+    row = cur.fetchone()
+    return row[0] if row else None
+
+
+def set_meta(conn, key: str, value):
+    conn.execute(
+        "INSERT INTO meta (key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+        (key, value),
+    )
     conn.commit()
 
 
-def _retry_write(
-    conn: sqlite3.Connection, sql: str, params: tuple = (), attempts: int = 3
-):
-    for i in range(attempts):
-        try:
-            conn.execute(sql, params)
-            return
-        except sqlite3.OperationalError as e:
-            if "locked" in str(e).lower() and i < attempts - 1:
-                time.sleep(0.2 * (i + 1))
-                continue
-            raise
+def update_validators(conn, validators: Dict[str, Tuple[Optional[str], Optional[str]]]):
+    """
+    Persist HTTP cache validators per meet URL.
+    validators: url -> (etag, last_modified).
+    """
+    if not validators:
+        return
+    conn.executemany(
+        "UPDATE meets SET etag=?, last_modified=? WHERE url=?",
+        [(etag, lm, url) for url, (etag, lm) in validators.items()],
+    )
+    conn.commit()
 
 
 # def _find_meet_by_file_path(conn, file_path: str):
@@ -376,61 +597,78 @@ def get_meet_by_id(conn, meet_id: int) -> Optional[dict]:
     }
 
 
+# Date helpers work by slicing instead of strptime/strftime: the formats
+# are a fixed set, every helper runs once per meet row during ingest and
+# export, and strptime's format machinery dominates their cost. date()
+# keeps the range validation (month 13, Feb 30, ...) strptime provided.
+_MONTH_NUM = {
+    "Jan": "01", "Feb": "02", "Mar": "03", "Apr": "04", "May": "05", "Jun": "06",
+    "Jul": "07", "Aug": "08", "Sep": "09", "Oct": "10", "Nov": "11", "Dec": "12",
+}
+_MONTH_ABBR = {v: k for k, v in _MONTH_NUM.items()}
+
+
+def _valid_dmy(day: str, month: str, year: str) -> bool:
+    try:
+        date(int(year), int(month), int(day))
+        return True
+    except ValueError:
+        return False
+
+
 # Formatting date for meet_date column
+@functools.lru_cache(maxsize=1024)
 def _pretty_date_from_ddmmyyyy(ddmmyyyy: Optional[str]) -> Optional[str]:
-    if not ddmmyyyy or len(ddmmyyyy) != 8:
+    # e.g. 12102025 -> "12 Oct 2025"; cached because meet_date mirrors
+    # meet_date_start and the same tokens recur across queue entries
+    if not ddmmyyyy or len(ddmmyyyy) != 8 or not ddmmyyyy.isdigit():
         return None
-    try:
-        # ddmmyyyy to datetime
-        from datetime import datetime
-
-        d = datetime.strptime(ddmmyyyy, "%d%m%Y")
-        return d.strftime("%d %b %Y")  # e.g., 12 Oct 2025
-    except Exception:
+    d, m, y = ddmmyyyy[:2], ddmmyyyy[2:4], ddmmyyyy[4:]
+    if m not in _MONTH_ABBR or not _valid_dmy(d, m, y):
         return None
+    return f"{d} {_MONTH_ABBR[m]} {y}"
 
 
 def _pretty_date_token(token: str) -> str | None:
     # Accept formats like 02Nov2024 and return "02 Nov 2024"
     if not token or len(token) != 9:
         return None
-    try:
-        d = datetime.strptime(token, "%d%b%Y")
-        return d.strftime("%d %b %Y")
-    except ValueError:
+    d, mon, y = token[:2], token[2:5].capitalize(), token[5:]
+    m = _MONTH_NUM.get(mon)
+    if not m or not d.isdigit() or not y.isdigit() or not _valid_dmy(d, m, y):
         return None
+    return f"{d} {mon} {y}"
 
 
 def _iso_from_token(token: Optional[str]) -> Optional[str]:
     # token like 02Nov2024 -> 2024-11-02
     if not token or len(token) != 9:
         return None
-    try:
-        d = datetime.strptime(token, "%d%b%Y")
-        return d.strftime("%Y-%m-%d")
-    except Exception:
+    d, mon, y = token[:2], token[2:5].capitalize(), token[5:]
+    m = _MONTH_NUM.get(mon)
+    if not m or not d.isdigit() or not y.isdigit() or not _valid_dmy(d, m, y):
         return None
+    return f"{y}-{m}-{d}"
 
 
 # Python
 def _pretty_from_iso(iso: Optional[str]) -> Optional[str]:
     if not iso:
         return None
-    try:
-        d = datetime.strptime(iso, "%Y-%m-%d")
-        return d.strftime("%d %b %Y")
-    except Exception:
-        return iso  # fallback to raw if unexpected
+    if len(iso) == 10:
+        y, m, d = iso[:4], iso[5:7], iso[8:]
+        if m in _MONTH_ABBR and d.isdigit() and y.isdigit() and _valid_dmy(d, m, y):
+            return f"{d} {_MONTH_ABBR[m]} {y}"
+    return iso  # fallback to raw if unexpected
 
 
 def _iso_from_ddmmyyyy(ddmmyyyy: Optional[str]) -> Optional[str]:
-    if not ddmmyyyy or len(ddmmyyyy) != 8:
+    if not ddmmyyyy or len(ddmmyyyy) != 8 or not ddmmyyyy.isdigit():
         return None
-    try:
-        d = datetime.strptime(ddmmyyyy, "%d%m%Y")
-        return d.strftime("%Y-%m-%d")
-    except Exception:
+    d, m, y = ddmmyyyy[:2], ddmmyyyy[2:4], ddmmyyyy[4:]
+    if not _valid_dmy(d, m, y):
         return None
+    return f"{y}-{m}-{d}"
 
 
 def find_meet_by_canonical(
@@ -469,35 +707,22 @@ def update_meet_from_hy3(conn, meet_row: dict, meet_data: dict):
     iso_start = _iso_from_ddmmyyyy(ddmmyyyy_start)
     iso_end = _iso_from_ddmmyyyy(ddmmyyyy_end)
 
-    # Canonical duplicate detection and merge
-    if meet_data.get("meet_name") and iso_start:
-        other_id = find_meet_by_canonical(
-            conn, meet_data["meet_name"].strip(), iso_start
-        )
-        if other_id and other_id != meet_row["id"]:
-            # Merge current row into the existing canonical row and stop
-            log_error(
-                conn,
-                file_path=(
-                    meet_row.get("file_path") if isinstance(meet_row, dict) else None
-                ),
-                error_type="CanonicalMerge",
-                message=f"Merging meet {meet_row['id']} into canonical {other_id}",
-                context={
-                    "source_id": meet_row["id"],
-                    "target_id": other_id,
-                    "meet_name": meet_data["meet_name"],
-                    "meet_date_start_iso": iso_start,
-                },
-            )
-            merge_meets(conn, source_id=meet_row["id"], target_id=other_id)
-            return
-
+    # No canonical pre-lookup: ux_meets_canonical enforces the identity, so
+    # the rare duplicate surfaces as an IntegrityError below and merges there,
+    # keeping the common path at a single UPDATE
+    meet_name = (meet_data.get("meet_name") or "").strip() or None
+    course = meet_data.get("course")
+    location = meet_data.get("location_text")
     meet_year = meet_data.get("meet_year")
 
+    # Nothing beyond the parsed flag to write: skip rewriting the metadata
+    # columns (and dirtying their page) entirely
+    if not any((meet_name, iso_start, iso_end, course, location, meet_year)):
+        mark_parsed(conn, meet_row["id"])
+        return
+
     try:
-        _retry_write(
-            conn,
+        conn.execute(
             """
             UPDATE meets
             SET meet_name       = COALESCE(?, meet_name),
@@ -511,12 +736,12 @@ def update_meet_from_hy3(conn, meet_row: dict, meet_data: dict):
             WHERE id = ?
             """,
             (
-                (meet_data.get("meet_name") or "").strip() or None,
+                meet_name,
                 iso_start,
                 iso_end,
                 iso_start,
-                meet_data.get("course"),
-                meet_data.get("location_text"),
+                course,
+                location,
                 meet_year,
                 meet_row["id"],
             ),
@@ -557,15 +782,14 @@ def insert_teams(conn, meet_id: int, teams: List[dict]) -> Dict[str, int]:
     """
     cur = conn.cursor()
     code_to_pk: Dict[str, int] = {}
-
-    for t in teams:
-        t_code = t.get("team_code", "")  # parser now emits "team_code"
-        t_name = t.get("team_name", "")
-        t_type = t.get("team_type", "")
-
-        # Upsert globally
-        _retry_write(
-            conn,
+    if not teams:
+        return code_to_pk
+
+    # One executemany upsert in one transaction instead of an
+    # upsert + SELECT round-trip per team. Ids come back afterwards with a
+    # single row-value IN lookup (executemany cannot carry RETURNING).
+    with conn:
+        cur.executemany(
             """
             INSERT INTO teams (team_code, team_name, team_type, region_code, region, address_1, address_2, city, postal_code)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -578,31 +802,29 @@ def insert_teams(conn, meet_id: int, teams: List[dict]) -> Dict[str, int]:
                 city=COALESCE(excluded.city, teams.city),
                 postal_code=COALESCE(excluded.postal_code, teams.postal_code)
             """,
-            (
-                t_code,
-                t_name,
-                t.get("team_type", "Other"),
-                t.get("region_code", ""),
-                t.get("region", ""),
-                t.get("address_1", ""),
-                t.get("address_2", ""),
-                t.get("city", ""),
-                t.get("postal_code", ""),
-            ),
-        )
-
-        # Fetch id
-        cur.execute(
-            "SELECT id FROM teams WHERE team_code=? AND team_name=?",
-            (t_code, t_name),
+            [
+                (
+                    t.get("team_code", ""),
+                    t.get("team_name", ""),
+                    t.get("team_type", "Other"),
+                    t.get("region_code", ""),
+                    t.get("region", ""),
+                    t.get("address_1", ""),
+                    t.get("address_2", ""),
+                    t.get("city", ""),
+                    t.get("postal_code", ""),
+                )
+                for t in teams
+            ],
         )
-        row = cur.fetchone()
 
-        if row:
-            team_pk = row[0]
-            code_to_pk[t_code] = team_pk
-
-    conn.commit()
+    keys = [(t.get("team_code", ""), t.get("team_name", "")) for t in teams]
+    qmarks = ",".join(["(?, ?)"] * len(keys))
+    cur.execute(
+        f"SELECT team_code, id FROM teams WHERE (team_code, team_name) IN (VALUES {qmarks})",
+        [v for key in keys for v in key],
+    )
+    code_to_pk.update(cur.fetchall())
     return code_to_pk
 
 
@@ -615,49 +837,81 @@ def insert_swimmers(
     """
     cur = conn.cursor()
     swimmer_ids: List[int] = []
+    if not swimmers:
+        return swimmer_ids
 
-    for s in swimmers:
-        team_pk = team_id_map.get(s.get("team_code", ""))
+    # Normalized identity keys, in input order: (first, last, gender,
+    # birth_date or '', mm_number, team_id or 0)
+    keys = [
+        (
+            s.get("first_name", ""),
+            s.get("last_name", ""),
+            s.get("gender", ""),
+            s.get("birth_date") or "",
+            s.get("mm_number", ""),
+            team_id_map.get(s.get("team_code", "")) or 0,
+        )
+        for s in swimmers
+    ]
 
-        # Insert or ignore if identity already exists
-        _retry_write(
-            conn,
+    # One executemany in one transaction instead of an INSERT + SELECT
+    # round-trip per swimmer
+    with conn:
+        cur.executemany(
             """
             INSERT OR IGNORE INTO swimmers (
-                team_id, first_name, last_name, gender, birth_date, mm_number
+                first_name, last_name, gender, birth_date, mm_number, team_id
             ) VALUES (?, ?, ?, ?, ?, ?)
             """,
-            (
-                team_pk,
-                s.get("first_name", ""),
-                s.get("last_name", ""),
-                s.get("gender", ""),
-                s.get("birth_date") or None,
-                s.get("mm_number", ""),
-            ),
+            [
+                (k[0], k[1], k[2], k[3] or None, k[4], k[5] or None)
+                for k in dict.fromkeys(keys)
+            ],
         )
 
-        # Select the ID (existing or newly inserted)
-        cur.execute(
-            """
-            SELECT id FROM swimmers
-            WHERE first_name=? AND last_name=? AND gender=?
-                  AND IFNULL(birth_date,'')=IFNULL(?, '') AND mm_number=? AND IFNULL(team_id, 0)=IFNULL(?, 0)
-            """,
-            (
-                s.get("first_name", ""),
-                s.get("last_name", ""),
-                s.get("gender", ""),
-                s.get("birth_date") or None,
-                s.get("mm_number", ""),
-                team_pk,
-            ),
+    # Resolve all ids with one temp-table join instead of chunked row-value
+    # IN probes: plain equality on the leading identity columns lets the
+    # planner drive ux_swimmers_identity, and executemany sidesteps the
+    # 999-bind-per-statement chunking
+    cur.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS _swimmer_ident (
+            first_name TEXT, last_name TEXT, gender TEXT,
+            birth_date TEXT, mm_number TEXT, team_id INTEGER
         )
-        row = cur.fetchone()
-        if row:
-            swimmer_ids.append(row[0])
-
-    conn.commit()
+        """
+    )
+    cur.execute("DELETE FROM _swimmer_ident")
+    cur.executemany(
+        "INSERT INTO _swimmer_ident VALUES (?, ?, ?, ?, ?, ?)",
+        list(dict.fromkeys(keys)),
+    )
+    id_by_key: Dict[tuple, int] = {}
+    cur.execute(
+        """
+        SELECT i.first_name, i.last_name, i.gender, i.birth_date, i.mm_number, i.team_id, s.id
+        FROM _swimmer_ident AS i
+        JOIN swimmers AS s
+          ON s.first_name = i.first_name
+         AND s.last_name = i.last_name
+         AND s.gender = i.gender
+         AND s.mm_number = i.mm_number
+         AND IFNULL(s.birth_date, '') = i.birth_date
+         AND IFNULL(s.team_id, 0) = i.team_id
+        """
+    )
+    for row in cur.fetchall():
+        # min() keeps the lowest id when NULL team_ids let the unique index
+        # admit duplicates, matching the old fetchone()
+        key, sid = tuple(row[:6]), row[6]
+        prev = id_by_key.get(key)
+        id_by_key[key] = sid if prev is None else min(prev, sid)
+    cur.execute("DELETE FROM _swimmer_ident")
+
+    for key in keys:
+        sid = id_by_key.get(key)
+        if sid is not None:
+            swimmer_ids.append(sid)
     return swimmer_ids
 
 
@@ -674,99 +928,79 @@ def merge_meets(conn, source_id: int, target_id: int):
     """
     cur = conn.cursor()
 
-    # Pull both rows
-    cur.execute(
-        "SELECT id, region, meet_name, url, processed_timestamp, downloaded, file_path, uploaded, processed_by_target, meet_date, meet_year, location, course, meet_date_start, meet_date_end, parsed FROM meets WHERE id=?",
-        (target_id,),
-    )
-    target = cur.fetchone()
+    # One probe for the uniquely-constrained columns; the rest of the field
+    # consolidation happens in SQL below
     cur.execute(
-        "SELECT id, region, meet_name, url, processed_timestamp, downloaded, file_path, uploaded, processed_by_target, meet_date, meet_year, location, course, meet_date_start, meet_date_end, parsed FROM meets WHERE id=?",
-        (source_id,),
+        "SELECT id, url, file_path FROM meets WHERE id IN (?, ?)",
+        (target_id, source_id),
     )
-    source = cur.fetchone()
-
-    if not target or not source:
+    rows = {row[0]: row for row in cur.fetchall()}
+    if target_id not in rows or source_id not in rows:
         return
 
-    target_url = target[3] or ""
-    source_url = source[3] or ""
+    target_url = rows[target_id][1] or ""
+    source_url = rows[source_id][1] or ""
+    source_file = rows[source_id][2] or ""
     # If target has manual URL, we want to promote to the source URL (community)
-    final_url = source_url if target_url.startswith("manual://") else target_url
-
-    target_file = target[6]
-    source_file = source[6]
-    new_file = target_file or source_file
-    downloaded = int((target[5] or 0) or (source[5] or 0))
-    uploaded = int((target[7] or 0) or (source[7] or 0))
-    processed_by_target = int((target[8] or 0) or (source[8] or 0))
-    meet_date = target[9] or source[9]
-    meet_year = target[10] or source[10]
-    location = target[11] or source[11]
-    course = target[12] or source[12]
-    meet_date_start = target[13] or source[13]
-    meet_date_end = target[14] or source[14]
-    parsed = int((target[15] or 0) or (source[15] or 0))
-
-    # 1) Temporarily move source URL to a unique sentinel so we can set target.url to source_url without violating UNIQUE(url)
-    # Use a sentinel guaranteed unique for this row
-    sentinel_url = f"manual://merged/{source_id}"
-    if source_url and source_url == final_url:
-        _retry_write(
-            conn, "UPDATE meets SET url=? WHERE id=?", (sentinel_url, source_id)
-        )
+    promote_url = bool(source_url) and target_url.startswith("manual://")
+    move_file = bool(source_file) and not (rows[target_id][2] or "")
+
+    with conn:
+        # 1) Temporarily move source URL to a unique sentinel so we can set
+        # target.url to source_url without violating UNIQUE(url); likewise
+        # clear source.file_path when it moves over (UNIQUE(file_path))
+        if promote_url:
+            conn.execute(
+                "UPDATE meets SET url=? WHERE id=?",
+                (f"manual://merged/{source_id}", source_id),
+            )
+        if move_file:
+            conn.execute("UPDATE meets SET file_path=NULL WHERE id=?", (source_id,))
 
-    # 2) Update target row (including URL promotion)
-    _retry_write(
-        conn,
-        """
-        UPDATE meets
-        SET url=COALESCE(?, url),
-            downloaded=?,
-            file_path=?,
-            uploaded=?,
-            processed_by_target=?,
-            meet_date=COALESCE(?, meet_date),
-            meet_year=COALESCE(?, meet_year),
-            location=COALESCE(?, location),
-            course=COALESCE(?, course),
-            meet_date_start=COALESCE(?, meet_date_start),
-            meet_date_end=COALESCE(?, meet_date_end),
-            parsed=?
-        WHERE id=?
-        """,
-        (
-            final_url,
-            downloaded,
-            new_file,
-            uploaded,
-            processed_by_target,
-            meet_date,
-            meet_year,
-            location,
-            course,
-            meet_date_start,
-            meet_date_end,
-            parsed,
-            target_id,
-        ),
-    )
-
-    # 3) Repoint links and queue to target
-    for table, col in [
-        ("meet_team", "meet_id"),
-        ("meet_swimmer", "meet_id"),
-        ("meet_team_swimmer", "meet_id"),
-        ("parse_queue", "meet_id"),
-        ("error_log", "meet_id"),
-    ]:
-        _retry_write(
-            conn, f"UPDATE {table} SET {col}=? WHERE {col}=?", (target_id, source_id)
+        # 2) Fold source into target in one UPDATE..FROM; '' counts as missing
+        # for dates/location to match the Python truthiness it replaced
+        conn.execute(
+            """
+            UPDATE meets AS t
+            SET url=CASE WHEN ? THEN ? ELSE t.url END,
+                downloaded=(COALESCE(t.downloaded, 0) OR COALESCE(s.downloaded, 0)),
+                file_path=CASE WHEN ? THEN ? ELSE t.file_path END,
+                uploaded=(COALESCE(t.uploaded, 0) OR COALESCE(s.uploaded, 0)),
+                processed_by_target=(COALESCE(t.processed_by_target, 0) OR COALESCE(s.processed_by_target, 0)),
+                meet_date=CASE WHEN IFNULL(t.meet_date, '') != '' THEN t.meet_date ELSE s.meet_date END,
+                meet_year=COALESCE(t.meet_year, s.meet_year),
+                location=CASE WHEN IFNULL(t.location, '') != '' THEN t.location ELSE s.location END,
+                course=CASE WHEN IFNULL(t.course, '') != '' THEN t.course ELSE s.course END,
+                meet_date_start=CASE WHEN IFNULL(t.meet_date_start, '') != '' THEN t.meet_date_start ELSE s.meet_date_start END,
+                meet_date_end=CASE WHEN IFNULL(t.meet_date_end, '') != '' THEN t.meet_date_end ELSE s.meet_date_end END,
+                parsed=(COALESCE(t.parsed, 0) OR COALESCE(s.parsed, 0))
+            FROM meets AS s
+            WHERE t.id=? AND s.id=?
+            """,
+            (
+                int(promote_url),
+                source_url,
+                int(move_file),
+                source_file,
+                target_id,
+                source_id,
+            ),
         )
 
-    # 4) Delete source row
-    _retry_write(conn, "DELETE FROM meets WHERE id=?", (source_id,))
-    conn.commit()
+        # 3) Repoint links and queue to target
+        for table, col in [
+            ("meet_team", "meet_id"),
+            ("meet_swimmer", "meet_id"),
+            ("meet_team_swimmer", "meet_id"),
+            ("parse_queue", "meet_id"),
+            ("error_log", "meet_id"),
+        ]:
+            conn.execute(
+                f"UPDATE {table} SET {col}=? WHERE {col}=?", (target_id, source_id)
+            )
+
+        # 4) Delete source row
+        conn.execute("DELETE FROM meets WHERE id=?", (source_id,))
 
 
 def link_meet_teams(conn, meet_id: int, team_ids: List[int]) -> None:
@@ -789,13 +1023,13 @@ def link_meet_teams(conn, meet_id: int, team_ids: List[int]) -> None:
                 message=f"Skipping None team_id for meet_id={meet_id}",
                 context={"meet_id": meet_id},
             )
-            continue
-        _retry_write(
-            conn,
+    # One prepared statement rebinding per row instead of an execute+commit
+    # per link
+    with conn:
+        conn.executemany(
             "INSERT OR IGNORE INTO meet_team (meet_id, team_id) VALUES (?, ?)",
-            (meet_id, tid),
+            [(meet_id, tid) for tid in team_ids if tid is not None],
         )
-    conn.commit()
 
 
 # Python
@@ -818,13 +1052,11 @@ def link_meet_swimmers(conn, meet_id: int, swimmer_ids: List[int]) -> None:
                 message=f"Skipping None swimmer_id for meet_id={meet_id}",
                 context={"meet_id": meet_id},
             )
-            continue
-        _retry_write(
-            conn,
+    with conn:
+        conn.executemany(
             "INSERT OR IGNORE INTO meet_swimmer (meet_id, swimmer_id) VALUES (?, ?)",
-            (meet_id, sid),
+            [(meet_id, sid) for sid in swimmer_ids if sid is not None],
         )
-    conn.commit()
 
 
 # Python
@@ -839,25 +1071,31 @@ def link_meet_teams_swimmers(conn, meet_id: int, swimmer_ids: List[int]) -> None
             context={"meet_id": meet_id},
         )
         return
-    for sid in swimmer_ids:
-        cur.execute("SELECT team_id FROM swimmers WHERE id=?", (sid,))
-        row = cur.fetchone()
-        team_id = row[0] if row else None
-        if team_id is None:
-            log_error(
-                conn,
-                file_path=None,
-                error_type="LinkWarning",
-                message=f"Swimmer {sid} has no team_id; cannot link meet_team_swimmer",
-                context={"meet_id": meet_id, "swimmer_id": sid},
-            )
-            continue
-        _retry_write(
+    # One INSERT...SELECT links every swimmer with a team in a single
+    # statement; a companion SELECT finds the team-less ones to warn about
+    ids = list(dict.fromkeys(swimmer_ids))
+    qmarks = ",".join(["?"] * len(ids))
+    with conn:
+        cur.execute(
+            f"""
+            INSERT OR IGNORE INTO meet_team_swimmer (meet_id, team_id, swimmer_id)
+            SELECT ?, team_id, id FROM swimmers
+            WHERE id IN ({qmarks}) AND team_id IS NOT NULL
+            """,
+            [meet_id, *ids],
+        )
+    cur.execute(
+        f"SELECT id FROM swimmers WHERE id IN ({qmarks}) AND team_id IS NULL",
+        ids,
+    )
+    for (sid,) in cur.fetchall():
+        log_error(
             conn,
-            "INSERT OR IGNORE INTO meet_team_swimmer (meet_id, team_id, swimmer_id) VALUES (?, ?, ?)",
-            (meet_id, team_id, sid),
+            file_path=None,
+            error_type="LinkWarning",
+            message=f"Swimmer {sid} has no team_id; cannot link meet_team_swimmer",
+            context={"meet_id": meet_id, "swimmer_id": sid},
         )
-    conn.commit()
 
 
 def log_error(
@@ -869,21 +1107,60 @@ def log_error(
     meet_id: Optional[int] = None,
     region: Optional[str] = None,
 ):
-    _retry_write(
-        conn,
-        """INSERT INTO error_log (timestamp, file_path, meet_id, region, error_type, message, context_json)
-           VALUES (?, ?, ?, ?, ?, ?, ?)""",
-        (
-            datetime.now().isoformat(),
-            file_path,
-            meet_id,
-            region,
-            error_type,
-            message,
-            json.dumps(context) if context else None,
-        ),
+    """Queue one error row; actual INSERTs happen in flush_errors batches."""
+    row = (
+        datetime.now().isoformat(),
+        file_path,
+        meet_id,
+        region,
+        error_type,
+        message,
+        _dumps_context(context) if context else None,
     )
-    conn.commit()
+    buf = getattr(conn, "_error_buf", None)
+    if buf is None:
+        try:
+            buf = conn._error_buf = []
+            _BUFFERED_CONNECTIONS.add(conn)
+        except AttributeError:
+            # Plain sqlite3.Connection (not from init_db): write through
+            conn.execute(_ERROR_INSERT_SQL, row)
+            conn.commit()
+            return
+    buf.append(row)
+    if len(buf) >= ERROR_BUFFER_LIMIT:
+        flush_errors(conn)
+
+
+def flush_errors(conn) -> None:
+    """Write buffered log_error rows in one executemany.
+
+    Link warnings fan out per swimmer, so committing each one separately made
+    error-heavy ingests fsync-bound; buffering trades a little durability for
+    one transaction per batch. Piggybacks on an open transaction when the
+    caller is already inside one.
+    """
+    buf = getattr(conn, "_error_buf", None)
+    if not buf:
+        return
+    rows, buf[:] = list(buf), []
+    if conn.in_transaction:
+        conn.executemany(_ERROR_INSERT_SQL, rows)
+    else:
+        with conn:
+            conn.executemany(_ERROR_INSERT_SQL, rows)
+
+
+def _flush_all_error_buffers() -> None:
+    # Last-chance flush so buffered errors survive normal interpreter exit
+    for conn in list(_BUFFERED_CONNECTIONS):
+        try:
+            flush_errors(conn)
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(_flush_all_error_buffers)
 
 
 def get_parse_queue(conn) -> List[dict]:
@@ -891,7 +1168,8 @@ def get_parse_queue(conn) -> List[dict]:
     cur.execute(
         """SELECT id, meet_id, file_path, status, message FROM parse_queue WHERE status IN ('queued','retry') ORDER BY id ASC"""
     )
-    rows = cur.fetchall()
+    # Build dicts straight off the cursor; no intermediate fetchall list.
+    # Still returns a list because callers branch on len() before fanning out.
     return [
         {
             "id": r[0],
@@ -900,15 +1178,14 @@ def get_parse_queue(conn) -> List[dict]:
             "status": r[3],
             "message": r[4],
         }
-        for r in rows
+        for r in cur
     ]
 
 
 def update_parse_queue_status(
     conn, queue_id: int, status: str, message: Optional[str] = None
 ):
-    _retry_write(
-        conn,
+    conn.execute(
         "UPDATE parse_queue SET status=?, message=?, updated_at=? WHERE id=?",
         (status, message, datetime.now().isoformat(), queue_id),
     )
@@ -916,14 +1193,39 @@ def update_parse_queue_status(
 
 
 def enqueue_for_parse(conn, meet_id: int, file_path: str):
-    _retry_write(
-        conn,
-        "INSERT INTO parse_queue (meet_id, file_path, status, created_at, updated_at) VALUES (?, ?, 'queued', ?, ?)",
-        (meet_id, file_path, datetime.now().isoformat(), datetime.now().isoformat()),
+    # OR IGNORE: ux_parse_queue_pending silently drops re-enqueues of an item
+    # that is already queued or awaiting retry
+    now = datetime.now().isoformat()
+    conn.execute(
+        "INSERT OR IGNORE INTO parse_queue (meet_id, file_path, status, created_at, updated_at) VALUES (?, ?, 'queued', ?, ?)",
+        (meet_id, file_path, now, now),
     )
     conn.commit()
 
 
+def enqueue_many(conn, pairs: List[Tuple[int, str]]) -> List[int]:
+    """
+    Queue many (meet_id, file_path) pairs for parsing in one transaction.
+    Returns the new parse_queue ids; pairs already pending in the queue are
+    skipped via ux_parse_queue_pending. Rows go through one cached statement
+    in a loop rather than executemany because the CLI summaries need each id.
+    """
+    if not pairs:
+        return []
+    now = datetime.now().isoformat()
+    queue_ids: List[int] = []
+    cur = conn.cursor()
+    with conn:
+        for meet_id, file_path in pairs:
+            cur.execute(
+                "INSERT OR IGNORE INTO parse_queue (meet_id, file_path, status, created_at, updated_at) VALUES (?, ?, 'queued', ?, ?)",
+                (meet_id, file_path, now, now),
+            )
+            if cur.rowcount:
+                queue_ids.append(cur.lastrowid)
+    return queue_ids
+
+
 def mark_parsed(conn, meet_id: int):
-    _retry_write(conn, "UPDATE meets SET parsed=1 WHERE id=?", (meet_id,))
+    conn.execute("UPDATE meets SET parsed=1 WHERE id=?", (meet_id,))
     conn.commit()
@@ -1,17 +1,21 @@
 # Python
+import functools
 import re
 from pathlib import Path
 
-# 02Nov2024, 08Aug2025 etc.
-DATE_TOKEN_RE = re.compile(r"(0[1-9]|[12][0-9]|3[01])[A-Za-z]{3}\d{4}")
-# Trailing -NNN code at the end of base filename
-TRAILING_CODE_RE = re.compile(r"(.*?)-\d{3}$")
+# 02Nov2024, 08Aug2025 etc. Non-capturing with re.ASCII: no group to
+# allocate per match, and \d / [A-Za-z] skip the Unicode tables
+DATE_TOKEN_RE = re.compile(r"(?:0[1-9]|[12][0-9]|3[01])[A-Za-z]{3}\d{4}", re.ASCII)
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_date_token(base_no_ext: str):
     """
     Find date tokens like 08Aug2025 in a base filename (no extension).
     Returns (date_token, year_int) or (None, None).
+
+    Cached: the same base names come through both the page parse and the
+    download bookkeeping, so repeat calls skip the regex scan.
     """
     m = DATE_TOKEN_RE.search(base_no_ext)
     if not m:
@@ -24,12 +28,18 @@ def extract_date_token(base_no_ext: str):
     return token, year
 
 
+@functools.lru_cache(maxsize=4096)
 def base_name_without_ext_and_code(filename: str) -> str:
     """
     Remove extension and a trailing '-NNN' code if present.
     Returns the cleaned base name.
+
+    Cached alongside extract_date_token: both run on the same filenames
+    during the scan and again during download bookkeeping.
     """
     suffix = Path(filename).suffix
     base = filename[: -len(suffix)] if suffix else filename
-    m = TRAILING_CODE_RE.match(base)
-    return m.group(1) if m else base
+    # Trailing '-NNN' code, checked by slicing instead of a lazy-wildcard regex
+    if len(base) >= 4 and base[-4] == "-" and base[-3:].isdigit():
+        return base[:-4]
+    return base